@@ -5,6 +5,6 @@ from __future__ import annotations
 from importlib.metadata import PackageNotFoundError, version
 
 try:
-    __version__ = version("git-projects")
+    __version__ = version("git-proj")
 except PackageNotFoundError:  # pragma: no cover
     __version__ = "0.0.0"
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    """Console entry point; answers --version without importing typer or building the app."""
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        from importlib.metadata import version
+
+        print(version("git-proj"))
+        return
+
+    from git_projects.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
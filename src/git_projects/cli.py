@@ -1,16 +1,14 @@
 from __future__ import annotations
 
 import importlib.metadata
-import json
+import os
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Annotated
 
-import httpx
 import typer
 
 from git_projects import config, index
-from git_projects.formatting import format_repo
+from git_projects.formatting import bold, format_repo
 from git_projects.services import fetch_repos, sync_projects, track_project, untrack_project
 
 app = typer.Typer(no_args_is_help=True)
@@ -83,6 +81,8 @@ def fetch(
     foundry_name: Annotated[str | None, typer.Argument(help="Foundry name to fetch from.")] = None,
 ) -> None:
     """Fetch repos from foundry APIs and save to local index."""
+    import httpx
+
     cfg = _load_config_or_exit()
 
     errors: list[str] = []
@@ -140,18 +140,19 @@ def list_repos(
     tracked: dict[str, str] = {}
     try:
         cfg = config.load_config()
-        clone_root = str(Path(cfg.clone_root).expanduser())
+        clone_root = os.path.expanduser(cfg.clone_root)
         for p in config.load_projects():
-            tracked[p.clone_url] = str(Path(clone_root) / p.path)
+            tracked[p.clone_url] = os.path.join(clone_root, p.path)
     except FileNotFoundError:
         pass
 
-    summary = typer.style(f"{len(repos)} repos", bold=True)
+    summary = bold(f"{len(repos)} repos")
     print(f"{summary}\n{'─' * 60}")
 
+    now = datetime.now(timezone.utc)
     for repo in repos:
         print()
-        print(format_repo(repo, tracked_path=tracked.get(repo.clone_url)), end="")
+        print(format_repo(repo, tracked_path=tracked.get(repo.clone_url), now=now), end="")
 
 
 @app.command()
@@ -192,9 +193,9 @@ def untrack(
     print(f"Untracked {name}")
 
 
-def _format_age(dt: datetime) -> str:
+def _format_age(dt: datetime, now: datetime | None = None) -> str:
     """Format a datetime as a human-readable relative age string."""
-    delta = datetime.now(timezone.utc) - dt
+    delta = (now or datetime.now(timezone.utc)) - dt
     seconds = int(delta.total_seconds())
     if seconds < 60:
         return "just now"
@@ -216,15 +217,14 @@ def info() -> None:
     except importlib.metadata.PackageNotFoundError:
         version = "unknown"
 
-    typer.echo(f"git-projects {typer.style(version, bold=True)}")
-    typer.echo()
+    lines = [f"git-projects {typer.style(version, bold=True)}", ""]
 
     # Config section
     config_path = config.get_config_path()
     if config_path.exists():
-        typer.echo(f"Config    {typer.style(str(config_path), dim=True)}")
+        lines.append(f"Config    {typer.style(str(config_path), dim=True)}")
     else:
-        typer.echo(
+        lines.append(
             f"Config    {typer.style(str(config_path), dim=True)}  "
             f"{typer.style('(not found)', dim=True)}"
         )
@@ -233,24 +233,24 @@ def info() -> None:
     projects_path = config.get_projects_path()
     n_tracked = len(config.load_projects())
     if config_path.exists():
-        typer.echo(f"Projects  {typer.style(str(projects_path), dim=True)}")
-        typer.echo(f"          {typer.style(f'{n_tracked} tracked projects', dim=True)}")
+        lines.append(f"Projects  {typer.style(str(projects_path), dim=True)}")
+        lines.append(f"          {typer.style(f'{n_tracked} tracked projects', dim=True)}")
 
     # Index section
     index_path = index.get_index_path()
-    if index_path.exists():
-        raw = json.loads(index_path.read_text())
-        n_repos = len(raw.get("repos", []))
-        updated_at = datetime.fromisoformat(raw["updated_at"])
-        age = _format_age(updated_at)
-        typer.echo(f"Index     {typer.style(str(index_path), dim=True)}")
-        typer.echo(f"          {typer.style(f'{n_repos} repos, updated {age}', dim=True)}")
+    meta = index.load_index_meta()
+    if meta is not None:
+        age = _format_age(datetime.fromisoformat(meta.updated_at))
+        lines.append(f"Index     {typer.style(str(index_path), dim=True)}")
+        lines.append(f"          {typer.style(f'{meta.n_repos} repos, updated {age}', dim=True)}")
     else:
-        typer.echo(
+        lines.append(
             f"Index     {typer.style(str(index_path), dim=True)}  "
             f"{typer.style('(not found)', dim=True)}"
         )
 
+    typer.echo("\n".join(lines))
+
 
 @app.command()
 def sync(
@@ -267,21 +267,23 @@ def sync(
         print("No projects tracked. Use 'git-projects track <name>' to add one.")
         return
 
-    clone_root = Path(cfg.clone_root).expanduser()
+    clone_root = os.path.expanduser(cfg.clone_root)
     resolved = [
-        config.Project(clone_url=p.clone_url, name=p.name, path=str(clone_root / p.path))
+        config.Project(clone_url=p.clone_url, name=p.name, path=os.path.join(clone_root, p.path))
         for p in projects
     ]
 
-    _STATUS_COLOR = {
-        "cloned": "cyan",
-        "synced": "green",
-        "skipped (dirty)": "yellow",
+    _STATUS_LABEL = {
+        status: typer.style(status, fg=color)
+        for status, color in {
+            "cloned": "cyan",
+            "synced": "green",
+            "skipped (dirty)": "yellow",
+        }.items()
     }
 
     def _on_project(name: str, status: str, git_ops: list[tuple[str, str]]) -> None:
-        color = _STATUS_COLOR.get(status, "red")
-        label = typer.style(status, fg=color)
+        label = _STATUS_LABEL.get(status) or typer.style(status, fg="red")
         print(f"  {name}  {label}")
         for cmd, output in git_ops:
             print(typer.style(f"    {cmd}", dim=True))
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import json
-import re
+import contextlib
+import copy
+import functools
+import os
+import stat
 from dataclasses import dataclass
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
 
-import yaml
 from platformdirs import user_data_path
 
+from git_projects import filecache, jsonio
+
 DEFAULT_CONFIG = """\
 clone_root: ~/projects    # where repos get cloned
 clone_url_format: ssh     # "https" or "ssh"
@@ -25,10 +29,8 @@ foundries:
   #   token: ""
 """
 
-_SSH_RE = re.compile(r"^git@[^:]+:(.+)$")
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FoundryConfig:
     name: str
     type: str
@@ -36,14 +38,14 @@ class FoundryConfig:
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Project:
     clone_url: str
     name: str
     path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     clone_root: str
     foundries: list[FoundryConfig]
@@ -58,6 +60,7 @@ class ConfigExistsError(Exception):
         self.path = path
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Return the absolute path to config.yaml (may not exist yet)."""
     return user_data_path("git-projects") / "config.yaml"
@@ -73,12 +76,71 @@ def init_config(*, force: bool = False) -> Path:
     return config_path
 
 
+def _sidecar_path(config_path: Path) -> Path:
+    """Return the path of the JSON cache written next to config.yaml."""
+    return config_path.with_name(config_path.name + ".json")
+
+
+def _write_sidecar(config_path: Path, source_key: filecache.StatKey, raw: object) -> None:
+    """Atomically write the parsed config as JSON next to config.yaml.
+
+    source_key is the stat key of the config.yaml that raw was parsed from; the
+    sidecar is only used while config.yaml still has exactly that key. The sidecar
+    holds the foundry tokens too, so it gets config.yaml's permissions before any
+    data is written. A failed write only costs a YAML parse next time.
+    """
+    sidecar = _sidecar_path(config_path)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    with contextlib.suppress(OSError, TypeError):
+        data = jsonio.dumps({"source": source_key, "config": raw})
+        with tmp.open("wb") as fh:
+            os.chmod(tmp, stat.S_IMODE(config_path.stat().st_mode))
+            fh.write(data)
+        os.replace(tmp, sidecar)
+
+
+def _read_sidecar(config_path: Path) -> dict[str, Any] | None:
+    """Return the cached config if the sidecar matches the current config.yaml, else None.
+
+    A chmod of config.yaml leaves its stat key alone, so the sidecar's permission
+    bits are brought back in line here.
+    """
+    sidecar = _sidecar_path(config_path)
+    try:
+        raw = jsonio.loads(sidecar.read_bytes())
+        if raw["source"] != list(filecache.stat_key(config_path)):
+            return None
+        mode = stat.S_IMODE(config_path.stat().st_mode)
+        if stat.S_IMODE(sidecar.stat().st_mode) != mode:
+            os.chmod(sidecar, mode)
+        cached = raw["config"]
+    except (OSError, ValueError, KeyError, TypeError):  # missing, corrupt or stale sidecar
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
 def load_config() -> Config:
-    """Load and parse config.yaml."""
+    """Load and parse config.yaml, reusing the last parse while the file is unchanged.
+
+    On a cold start a JSON sidecar (config.yaml.json) written for exactly this
+    config.yaml (same stat key) is read instead of parsing YAML.
+    """
     config_path = get_config_path()
     if not config_path.exists():
         raise FileNotFoundError(config_path)
-    raw = yaml.safe_load(config_path.read_text())
+    return filecache.cached_read(config_path, _parse_config, copy.deepcopy)
+
+
+def _parse_config(config_path: Path) -> Config:
+    raw = _read_sidecar(config_path)
+    if raw is None:
+        import yaml
+
+        source_key = filecache.stat_key(config_path)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when available
+        with config_path.open("rb") as fh:
+            raw = yaml.load(fh, Loader=loader)
+        _write_sidecar(config_path, source_key, raw)
     foundries = [
         FoundryConfig(
             name=str(f["name"]),
@@ -97,6 +159,8 @@ def load_config() -> Config:
 
 def save_config(config: Config) -> Path:
     """Write config to config.yaml and return its path."""
+    import yaml
+
     config_path = get_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
     data: dict[str, object] = {
@@ -111,21 +175,35 @@ def save_config(config: Config) -> Path:
             for f in config.foundries
         ],
     }
-    config_path.write_text(yaml.dump(data, default_flow_style=False, allow_unicode=True))
+    config_path.write_text(
+        yaml.dump(
+            data,
+            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False,
+            allow_unicode=True,
+        )
+    )
+    _write_sidecar(config_path, filecache.stat_key(config_path), data)
+    filecache.remember(config_path, copy.deepcopy(config))
     return config_path
 
 
+@functools.lru_cache(maxsize=1)
 def get_projects_path() -> Path:
     """Return the absolute path to projects.json (may not exist yet)."""
     return user_data_path("git-projects") / "projects.json"
 
 
 def load_projects() -> list[Project]:
-    """Load tracked projects from projects.json. Returns [] if file missing."""
+    """Load tracked projects from projects.json (cached by file signature). [] if missing."""
     projects_path = get_projects_path()
     if not projects_path.exists():
         return []
-    raw = json.loads(projects_path.read_text())
+    return filecache.cached_read(projects_path, _parse_projects, list)
+
+
+def _parse_projects(projects_path: Path) -> list[Project]:
+    raw = jsonio.loads(projects_path.read_bytes())
     return [
         Project(
             clone_url=str(p["clone_url"]),
@@ -140,18 +218,24 @@ def save_projects(projects: list[Project]) -> Path:
     """Write projects list to projects.json and return its path."""
     projects_path = get_projects_path()
     projects_path.parent.mkdir(parents=True, exist_ok=True)
-    projects_path.write_text(
-        json.dumps(
+    projects_path.write_bytes(
+        jsonio.dumps(
             [{"clone_url": p.clone_url, "name": p.name, "path": p.path} for p in projects],
-            indent=2,
+            indent=True,
         )
     )
+    filecache.remember(projects_path, list(projects))
     return projects_path
 
 
 def derive_project(clone_url: str) -> Project:
     """Derive project name and relative path from a clone URL (HTTPS or SSH SCP-style)."""
-    m = _SSH_RE.match(clone_url)
-    path_part = m.group(1) if m else urlparse(clone_url).path
-    name = path_part.strip("/").removesuffix(".git").split("/")[-1]
+    end = len(clone_url)
+    while end and clone_url[end - 1] == "/":
+        end -= 1
+    if clone_url.endswith(".git", 0, end):
+        end -= 4
+    # the name starts after the last '/' (path) or ':' (SCP-style host:repo)
+    start = max(clone_url.rfind("/", 0, end), clone_url.rfind(":", 0, end)) + 1
+    name = clone_url[start:end]
     return Project(clone_url=clone_url, name=name, path=name)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+StatKey = tuple[int, int, int]
+
+_CACHE: dict[Path, tuple[StatKey, Any]] = {}
+
+
+def stat_key(path: Path) -> StatKey:
+    """Return a (mtime_ns, size, inode) signature used to detect file changes."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def cached_read(path: Path, parse: Callable[[Path], T], clone: Callable[[T], T]) -> T:
+    """Return parse(path), reusing the previous result while the file signature is unchanged.
+
+    The cache holds its own copy; callers always receive clone(value) so they may mutate it.
+    """
+    key = stat_key(path)
+    hit = _CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        value: T = clone(hit[1])
+        return value
+    value = parse(path)
+    _CACHE[path] = (key, clone(value))
+    return value
+
+
+def remember(path: Path, value: object) -> None:
+    """Record value as the parsed contents of path, which has just been written."""
+    _CACHE[path] = (stat_key(path), value)
@@ -1,70 +1,88 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import Any
 
 import typer
 
 from git_projects.foundry import RemoteRepo
 
 
-def relative_time(iso_timestamp: str) -> str:
-    """Return a human-relative string for an ISO 8601 UTC timestamp."""
-    dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
-    delta = datetime.now(timezone.utc) - dt
-    seconds = int(delta.total_seconds())
-    if seconds < 60:
+def _styler(**styles: Any) -> Callable[[str], str]:
+    """Return a function equivalent to typer.style(text, **styles) with the codes built once."""
+    prefix, suffix = typer.style("\0", **styles).split("\0")
+    return lambda text: f"{prefix}{text}{suffix}"
+
+
+bold = _styler(bold=True)
+dim = _styler(dim=True)
+_red = _styler(fg=typer.colors.RED)
+_green = _styler(fg=typer.colors.GREEN)
+_bright_blue = _styler(fg=typer.colors.BRIGHT_BLUE)
+
+# relative_time buckets: upper bound in seconds, label, and seconds per displayed unit
+# (a "month" is 30 days, so the months bucket ends at 360 days)
+_AGE_BOUNDS = (60, 3600, 86400, 30 * 86400, 360 * 86400)
+_AGE_LABELS = (
+    "just now",
+    "{} minutes ago",
+    "{} hours ago",
+    "{} days ago",
+    "{} months ago",
+    "{} years ago",
+)
+_AGE_UNITS = (1, 60, 3600, 86400, 30 * 86400, 365 * 86400)
+
+
+def relative_time(iso_timestamp: str, now: datetime | None = None) -> str:
+    """Return a human-relative string for an ISO 8601 UTC timestamp.
+
+    Pass *now* when formatting many timestamps to compare them all against one instant.
+    """
+    dt = datetime.fromisoformat(iso_timestamp)
+    seconds = int(((now or datetime.now(timezone.utc)) - dt).total_seconds())
+    bucket = bisect_right(_AGE_BOUNDS, seconds)
+    if bucket == 0:
         return "just now"
-    minutes = seconds // 60
-    if minutes < 60:
-        return f"{minutes} minutes ago"
-    hours = minutes // 60
-    if hours < 24:
-        return f"{hours} hours ago"
-    days = hours // 24
-    if days < 30:
-        return f"{days} days ago"
-    months = days // 30
-    if months < 12:
-        return f"{months} months ago"
-    years = days // 365
-    return f"{years} years ago"
+    return _AGE_LABELS[bucket].format(seconds // _AGE_UNITS[bucket])
 
 
 def format_header(name: str, count: int, width: int = 60) -> str:
     """Return a section header for a foundry."""
-    label = typer.style(f"{name.upper()}  {count} repos", bold=True)
+    label = bold(f"{name.upper()}  {count} repos")
     return f"\n{label}\n{'─' * width}"
 
 
 def format_repo(
-    repo: RemoteRepo, width: int = 60, max_desc: int = 60, tracked_path: str | None = None
+    repo: RemoteRepo,
+    width: int = 60,
+    max_desc: int = 60,
+    tracked_path: str | None = None,
+    now: datetime | None = None,
 ) -> str:
     """Return an indented multi-line block describing one remote repo."""
-    date = relative_time(repo.pushed_at)
+    date = relative_time(repo.pushed_at, now)
     vis_label = f"[{repo.visibility}]"
-    vis_color = typer.colors.RED if repo.visibility == "public" else typer.colors.GREEN
-
-    # Build display identifier: slug + original name in parens when they differ
-    show_original = repo.slug != repo.name.lower()
-    display = repo.slug + (f" ({repo.name})" if show_original else "")
+    vis_style = _red if repo.visibility == "public" else _green
 
-    # Compute plain-text width for correct padding
-    plain_left = display + " " + vis_label
-    padding = max(1, width - len(plain_left) - len(date))
+    # Display identifier: slug + original name in parens when they differ
+    slug = repo.slug
+    name_suffix = f" ({repo.name})" if slug != repo.name.lower() else ""
 
-    slug_styled = typer.style(repo.slug, bold=True)
-    name_suffix = typer.style(f" ({repo.name})", dim=True) if show_original else ""
-    vis_styled = typer.style(vis_label, fg=vis_color)
-    date_styled = typer.style(date, dim=True)
-    repo_url_styled = typer.style(repo.repo_url, dim=True)
+    # Pad on plain-text width so the date column lines up despite ANSI codes
+    padding = max(1, width - len(slug) - len(name_suffix) - 1 - len(vis_label) - len(date))
 
-    name_line = slug_styled + name_suffix + " " + vis_styled + " " * padding + date_styled
-    lines = [name_line, f"  {repo_url_styled}"]
+    parts = [bold(slug)]
+    if name_suffix:
+        parts.append(dim(name_suffix))
+    parts += [" ", vis_style(vis_label), " " * padding, dim(date), "\n  ", dim(repo.repo_url), "\n"]
     if repo.description:
         desc = repo.description
         if len(desc) > max_desc:
             desc = desc[: max_desc - 1] + "…"
-        lines.append(f"  {desc}")
+        parts += ["  ", desc, "\n"]
     if tracked_path:
-        lines.append(f"  {typer.style(f'→ {tracked_path}', fg=typer.colors.BRIGHT_BLUE)}")
-    return "\n".join(lines) + "\n"
+        parts += ["  ", _bright_blue(f"→ {tracked_path}"), "\n"]
+    return "".join(parts)
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+from git_projects import httpcache, jsonio
 
-@dataclass
+if TYPE_CHECKING:
+    import httpx
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+_LAST_RE = re.compile(r'<([^>]+)>;\s*rel="last"')
+_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+_PAGE_WORKERS = 4
+
+
+@dataclass(slots=True, frozen=True)
 class RemoteRepo:
     name: str
     repo_url: str
@@ -17,4 +32,83 @@ class RemoteRepo:
     @property
     def slug(self) -> str:
         """URL-safe identifier derived from name: lowercase, non-alphanumeric runs → hyphens."""
-        return re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-")
+        return _SLUG_RE.sub("-", self.name.lower()).strip("-")
+
+
+@functools.lru_cache(maxsize=1)
+def http2_available() -> bool:
+    """Return True if the optional h2 package is installed, so httpx can speak HTTP/2.
+
+    Concurrent page requests are then multiplexed over one connection per host.
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def next_url(link_header: str) -> str | None:
+    """Parse the 'next' URL from a Link response header."""
+    if 'rel="next"' not in link_header:
+        return None
+    match = _NEXT_RE.search(link_header)
+    return match.group(1) if match else None
+
+
+def _remaining_page_urls(link_header: str) -> list[str] | None:
+    """Return URLs of every page from 'next' to 'last', or None if the header lacks them."""
+    next_link = next_url(link_header)
+    last_match = _LAST_RE.search(link_header)
+    if next_link is None or last_match is None:
+        return None
+    next_page = _PAGE_RE.search(next_link)
+    last_page = _PAGE_RE.search(last_match.group(1))
+    if next_page is None or last_page is None:
+        return None
+    prefix, suffix = next_link[: next_page.start(1)], next_link[next_page.end(1) :]
+    first, last = int(next_page.group(1)), int(last_page.group(1))
+    return [f"{prefix}{n}{suffix}" for n in range(first, last + 1)]
+
+
+def _get_page(client: httpx.Client, url: str) -> tuple[list[Any], str]:
+    """GET one page and return its items and Link header.
+
+    A cached copy is revalidated with If-None-Match/If-Modified-Since and reused on 304.
+    """
+    cached = httpcache.lookup(url, client.headers)
+    response = client.get(url, headers=cached.validators() if cached else None)
+    if cached is not None and response.status_code == 304:
+        return cached.items, cached.link
+    response.raise_for_status()
+    items: list[Any] = list(jsonio.loads(response.content))
+    link_header = response.headers.get("Link", "")
+    page = httpcache.CachedPage(
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        link=link_header,
+        items=items,
+    )
+    httpcache.store(url, client.headers, page)
+    return items, link_header
+
+
+def fetch_pages(client: httpx.Client, url: str) -> list[Any]:
+    """GET a paginated JSON list endpoint and return the items of all pages in order.
+
+    When the first response links to its last page, the remaining pages are requested
+    concurrently on the same client; otherwise 'next' links are followed one by one.
+    Cached pages nobody has requested for two weeks are pruned first.
+    """
+    httpcache.prune()
+    items, link_header = _get_page(client, url)
+
+    page_urls = _remaining_page_urls(link_header)
+    if page_urls:
+        with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(page_urls))) as executor:
+            for page_items, _ in executor.map(lambda u: _get_page(client, u), page_urls):
+                items.extend(page_items)
+        return items
+
+    next_link = next_url(link_header)
+    while next_link:
+        page_items, link_header = _get_page(client, next_link)
+        items.extend(page_items)
+        next_link = next_url(link_header)
+    return items
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_cache_path
+
+from git_projects import jsonio
+
+# entries not stored or looked up for this long are deleted by prune()
+_MAX_AGE_SECONDS = 14 * 24 * 60 * 60
+
+
+@dataclass(slots=True, frozen=True)
+class CachedPage:
+    etag: str | None
+    last_modified: str | None
+    link: str
+    items: list[Any]
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers that revalidate this page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """Return the directory holding cached API pages (may not exist yet)."""
+    return user_cache_path("git-projects") / "http"
+
+
+def _entry_path(url: str, headers: Mapping[str, str]) -> Path:
+    # key on the request headers too, so different tokens never share an entry
+    key = "\n".join([url, *(f"{k}: {v}" for k, v in sorted(headers.items()))])
+    return get_cache_dir() / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def lookup(url: str, headers: Mapping[str, str]) -> CachedPage | None:
+    """Return the cached page for url requested with headers, or None.
+
+    A hit refreshes the entry's mtime, so pages still in use survive prune().
+    """
+    path = _entry_path(url, headers)
+    try:
+        raw = jsonio.loads(path.read_bytes())
+        page = CachedPage(
+            etag=raw["etag"],
+            last_modified=raw["last_modified"],
+            link=raw["link"],
+            items=raw["items"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return page
+
+
+def store(url: str, headers: Mapping[str, str], page: CachedPage) -> None:
+    """Cache page for url; pages without an ETag or Last-Modified are not worth keeping."""
+    if not (page.etag or page.last_modified):
+        return
+    path = _entry_path(url, headers)
+    data = {
+        "etag": page.etag,
+        "last_modified": page.last_modified,
+        "link": page.link,
+        "items": page.items,
+    }
+    # best effort: a failed write only costs a full response next time
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(jsonio.dumps(data))
+
+
+def prune(max_age: float = _MAX_AGE_SECONDS) -> None:
+    """Delete entries not stored or looked up within the last max_age seconds.
+
+    Entries are keyed on the request headers, so a rotated token or a changed page
+    size leaves the old entries unused; this keeps them from piling up.
+    """
+    cutoff = time.time() - max_age
+    for path in get_cache_dir().glob("*.json"):
+        # another thread may prune or rewrite the same entry concurrently
+        with contextlib.suppress(OSError):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
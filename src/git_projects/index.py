@@ -1,25 +1,75 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
+import pickle
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import Any
 
 from platformdirs import user_data_path
 
+from git_projects import __version__, filecache, jsonio
 from git_projects.foundry import RemoteRepo
 
+# index.json rows -> positional RemoteRepo arguments, in dataclass field order
+_repo_values = itemgetter(*(f.name for f in fields(RemoteRepo)))
 
+# bump when the layout of index.cache.pkl changes
+_PICKLE_FORMAT = 1
+
+
+@dataclass(slots=True)
+class IndexMeta:
+    n_repos: int
+    updated_at: str
+
+
+@functools.lru_cache(maxsize=1)
 def get_index_path() -> Path:
     """Return the absolute path to index.json (may not exist yet)."""
     return user_data_path("git-projects") / "index.json"
 
 
+def _meta_path(index_path: Path) -> Path:
+    return index_path.with_name("index.meta.json")
+
+
+def _pickle_path(index_path: Path) -> Path:
+    return index_path.with_name("index.cache.pkl")
+
+
+def _pickle_header(source_key: filecache.StatKey) -> tuple[object, ...]:
+    """Identify the code and the index.json a pickled repo list was built from."""
+    return (_PICKLE_FORMAT, __version__, tuple(f.name for f in fields(RemoteRepo)), source_key)
+
+
+class _RepoUnpickler(pickle.Unpickler):
+    """Unpickler that can only build RemoteRepo, so index.cache.pkl cannot run code."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) == (RemoteRepo.__module__, RemoteRepo.__qualname__):
+            return RemoteRepo
+        raise pickle.UnpicklingError(f"index cache may not refer to {module}.{name}")
+
+
+def _write_pickle(cache_path: Path, source_key: filecache.StatKey, repos: list[RemoteRepo]) -> None:
+    # best effort: the pickle only speeds up the next load, index.json is the source of truth
+    with contextlib.suppress(OSError), cache_path.open("wb") as fh:
+        # header first, so a mismatch is detected without unpickling stale RemoteRepo state
+        pickle.dump(_pickle_header(source_key), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(repos, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 def save_index(repos: list[RemoteRepo]) -> Path:
     """Write repos to index.json and return its path."""
     path = get_index_path()
     path.parent.mkdir(parents=True, exist_ok=True)
+    updated_at = datetime.now(timezone.utc).isoformat()
     data = {
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": updated_at,
         "repos": [
             {
                 "name": r.name,
@@ -33,28 +83,95 @@ def save_index(repos: list[RemoteRepo]) -> Path:
             for r in repos
         ],
     }
-    path.write_text(json.dumps(data, indent=2))
+    path.write_bytes(jsonio.dumps(data, indent=True))
+    filecache.remember(path, list(repos))
+    source_key = filecache.stat_key(path)
+    _write_pickle(_pickle_path(path), source_key, list(repos))
+    # best effort, like the pickle: load_index_meta falls back to index.json
+    meta = {"n_repos": len(repos), "updated_at": updated_at, "source": source_key}
+    with contextlib.suppress(OSError):
+        _meta_path(path).write_bytes(jsonio.dumps(meta))
     return path
 
 
 def load_index() -> list[RemoteRepo]:
-    """Load repos from index.json. Returns empty list if index does not exist."""
+    """Load repos from index.json, reusing the last parse while the file is unchanged.
+
+    A pickled copy (index.cache.pkl) is preferred over parsing the JSON when it was
+    written by this version for exactly the current index.json (same stat key).
+
+    Returns empty list if index does not exist.
+    """
     path = get_index_path()
     if not path.exists():
         return []
-    raw = json.loads(path.read_text())
-    return [
-        RemoteRepo(
-            name=r["name"],
-            repo_url=r["repo_url"],
-            clone_url=r["clone_url"],
-            pushed_at=r["pushed_at"],
-            default_branch=r["default_branch"],
-            visibility=r["visibility"],
-            description=r["description"],
-        )
-        for r in raw.get("repos", [])
-    ]
+    return filecache.cached_read(path, _parse_index, list)
+
+
+def _read_pickle(cache_path: Path, source_key: filecache.StatKey) -> list[RemoteRepo] | None:
+    """Return the pickled repos if their header matches this code and index.json, else None."""
+    try:
+        with cache_path.open("rb") as fh:
+            # one unpickler per object: each pickle.dump in _write_pickle starts a fresh memo
+            if _RepoUnpickler(fh).load() != _pickle_header(source_key):
+                return None
+            cached = _RepoUnpickler(fh).load()
+    except Exception:  # missing or unreadable cache: fall back to index.json
+        return None
+    return cached if isinstance(cached, list) else None
+
+
+def _parse_index(path: Path) -> list[RemoteRepo]:
+    cache_path = _pickle_path(path)
+    source_key = filecache.stat_key(path)
+    cached = _read_pickle(cache_path, source_key)
+    if cached is not None:
+        return cached
+    repos = _parse_index_json(path)
+    _write_pickle(cache_path, source_key, repos)
+    return repos
+
+
+def _parse_index_json(path: Path) -> list[RemoteRepo]:
+    raw = jsonio.loads(path.read_bytes())
+    return [RemoteRepo(*_repo_values(r)) for r in raw.get("repos", [])]
+
+
+def index_by_name(repos: list[RemoteRepo]) -> dict[str, tuple[RemoteRepo, ...]]:
+    """Group repos under both their name and their slug, keeping index order."""
+    table: dict[str, list[RemoteRepo]] = {}
+    for repo in repos:
+        for key in dict.fromkeys((repo.name, repo.slug)):
+            table.setdefault(key, []).append(repo)
+    return {key: tuple(group) for key, group in table.items()}
+
+
+def _read_meta(meta_path: Path, index_path: Path) -> IndexMeta | None:
+    """Return the summary if it was written for the current index.json and is well formed."""
+    try:
+        raw = jsonio.loads(meta_path.read_bytes())
+        if raw["source"] != list(filecache.stat_key(index_path)):
+            return None
+        return IndexMeta(n_repos=int(raw["n_repos"]), updated_at=str(raw["updated_at"]))
+    except (OSError, ValueError, KeyError, TypeError):  # missing or corrupt summary
+        return None
+
+
+def load_index_meta() -> IndexMeta | None:
+    """Return repo count and update time of the index, or None if it does not exist.
+
+    Reads the small index.meta.json summary written by save_index; falls back to
+    parsing index.json when the summary is missing, corrupt or was written for a
+    different index.json (stat key mismatch).
+    """
+    path = get_index_path()
+    if not path.exists():
+        return None
+    meta = _read_meta(_meta_path(path), path)
+    if meta is not None:
+        return meta
+    raw = jsonio.loads(path.read_bytes())
+    return IndexMeta(n_repos=len(raw.get("repos", [])), updated_at=str(raw["updated_at"]))
 
 
 def search_index(
@@ -68,4 +185,4 @@ def search_index(
         result = [
             r for r in result if q in r.name.lower() or q in r.slug or q in r.description.lower()
         ]
-    return sorted(result, key=lambda r: r.pushed_at)
+    return sorted(result, key=attrgetter("pushed_at"))
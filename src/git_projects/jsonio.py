@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(data: bytes | str) -> Any:
+        """Parse a JSON document."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+except ImportError:  # pragma: no cover - orjson not installed
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        """Parse a JSON document."""
+        return json.loads(data)
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces."""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-import threading
+import importlib
+import os
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from pathlib import Path
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
 
 from git_projects import config, index
 from git_projects.config import Config, Project
-from git_projects.foundry import RemoteRepo, gitea, github, gitlab
+from git_projects.foundry import RemoteRepo
 from git_projects.gitops import GitError, clone_repo, is_dirty, pull_repo, push_repo
 
+_FOUNDRY_TYPES = ("github", "gitlab", "gitea")
+_MAX_LISTED_MATCHES = 10
+
+
+def _list_repos_fn(foundry_type: str) -> Callable[[config.FoundryConfig, str], list[RemoteRepo]]:
+    """Import the adapter module for foundry_type on demand (keeps httpx off non-fetch paths)."""
+    module = importlib.import_module(f"git_projects.foundry.{foundry_type}")
+    list_fn: Callable[[config.FoundryConfig, str], list[RemoteRepo]] = module.list_repos
+    return list_fn
+
 
 def fetch_repos(
     cfg: Config,
@@ -29,34 +40,27 @@ def fetch_repos(
         if not foundries:
             raise ValueError(f"No foundry named '{foundry_name}' in config.")
 
-    lock = threading.Lock()
-    all_repos: list[RemoteRepo] = []
-
-    def _fetch_one(fc: config.FoundryConfig) -> None:
-        if fc.type == "github":
-            list_fn = github.list_repos
-        elif fc.type == "gitlab":
-            list_fn = gitlab.list_repos
-        elif fc.type == "gitea":
-            list_fn = gitea.list_repos
-        else:
-            return
-        try:
-            repos = list_fn(fc, cfg.clone_url_format)
-            with lock:
-                all_repos.extend(repos)
-            if on_foundry:
-                on_foundry(fc.name, len(repos), None)
-        except Exception as exc:
-            if on_foundry:
-                on_foundry(fc.name, 0, exc)
+    def _fetch_one(fc: config.FoundryConfig) -> list[RemoteRepo]:
+        return _list_repos_fn(fc.type)(fc, cfg.clone_url_format)
 
-    with ThreadPoolExecutor(max_workers=max(1, len(foundries))) as executor:
-        futures = [executor.submit(_fetch_one, fc) for fc in foundries]
+    # workers only fetch; results and callbacks are handled here, on the calling thread
+    all_repos: list[RemoteRepo] = []
+    supported = [fc for fc in foundries if fc.type in _FOUNDRY_TYPES]
+    with ThreadPoolExecutor(max_workers=max(1, len(supported))) as executor:
+        futures = {executor.submit(_fetch_one, fc): fc for fc in supported}
         for future in as_completed(futures):
-            future.result()
+            name = futures[future].name
+            try:
+                repos = future.result()
+            except Exception as exc:
+                if on_foundry:
+                    on_foundry(name, 0, exc)
+                continue
+            all_repos.extend(repos)
+            if on_foundry:
+                on_foundry(name, len(repos), None)
 
-    all_repos.sort(key=lambda r: r.pushed_at)
+    all_repos.sort(key=attrgetter("pushed_at"))
     index.save_index(all_repos)
     return all_repos
 
@@ -78,7 +82,7 @@ def track_project(cfg: Config, name_or_url: str, path: str | None = None) -> Pro
         repos = index.load_index()
         if not repos:
             raise ValueError("Index is empty. Run 'git-projects fetch' first.")
-        exact = [r for r in repos if r.name == name_or_url or r.slug == name_or_url]
+        exact = index.index_by_name(repos).get(name_or_url, ())
         if len(exact) == 1:
             clone_url = exact[0].clone_url
         elif len(exact) > 1:
@@ -86,11 +90,19 @@ def track_project(cfg: Config, name_or_url: str, path: str | None = None) -> Pro
             raise ValueError(f"Ambiguous: '{name_or_url}' matches multiple repos: {urls}")
         else:
             q = name_or_url.lower()
-            partial = [r for r in repos if q in r.name.lower() or q in r.slug]
+            # scan in index order; stop once there are more matches than the error would list
+            partial: list[RemoteRepo] = []
+            for r in repos:
+                if q in r.name.lower() or q in r.slug:
+                    partial.append(r)
+                    if len(partial) > _MAX_LISTED_MATCHES:
+                        break
             if len(partial) == 1:
                 clone_url = partial[0].clone_url
             elif len(partial) > 1:
-                names = ", ".join(r.slug for r in partial)
+                names = ", ".join(r.slug for r in partial[:_MAX_LISTED_MATCHES])
+                if len(partial) > _MAX_LISTED_MATCHES:
+                    names += ", ..."
                 raise ValueError(f"Ambiguous: '{name_or_url}' matches: {names}. Be more specific.")
             else:
                 raise ValueError(
@@ -99,14 +111,12 @@ def track_project(cfg: Config, name_or_url: str, path: str | None = None) -> Pro
                 )
 
     projects = config.load_projects()
-    if any(p.clone_url == clone_url for p in projects):
+    if clone_url in {p.clone_url for p in projects}:
         raise ValueError(f"Already tracking: {clone_url}")
 
+    project = config.derive_project(clone_url)
     if path is not None:
-        parsed_name = clone_url.rstrip("/").removesuffix(".git").rsplit("/", 1)[-1]
-        project = Project(clone_url=clone_url, name=parsed_name, path=path)
-    else:
-        project = config.derive_project(clone_url)
+        project = replace(project, path=path)
     config.save_projects([*projects, project])
     return project
 
@@ -123,7 +133,10 @@ def untrack_project(cfg: Config, name: str) -> None:
     config.save_projects(filtered)
 
 
-@dataclass
+_GitOps = list[tuple[str, str]]
+
+
+@dataclass(slots=True)
 class SyncResult:
     cloned: list[str] = field(default_factory=list)
     synced: list[str] = field(default_factory=list)
@@ -142,55 +155,47 @@ def sync_projects(
     git_ops is a list of (cmd_display, output) pairs for the git commands run.
     Dirty repos are skipped; git errors are recorded and processing continues.
     """
-    result = SyncResult()
-    lock = threading.Lock()
 
-    def _sync_one(project: Project) -> None:
-        expanded = str(Path(project.path).expanduser())
+    def _sync_one(project: Project) -> tuple[str, _GitOps, GitError | None]:
+        """Return (outcome, git_ops, error); error is set only when outcome is "errored"."""
+        expanded = os.path.expanduser(project.path)
+        git_ops: _GitOps = []
 
-        if not Path(expanded).exists():
-            git_ops: list[tuple[str, str]] = []
+        if not os.path.exists(expanded):
             try:
                 cmd = f"git clone {project.clone_url} {expanded}"
-                output = clone_repo(project.clone_url, project.path)
-                git_ops.append((cmd, output))
-                with lock:
-                    result.cloned.append(project.name)
-                    if on_project:
-                        on_project(project.name, "cloned", git_ops)
+                git_ops.append((cmd, clone_repo(project.clone_url, project.path)))
             except GitError as exc:
-                with lock:
-                    result.errored.append((project.name, str(exc)))
-                    if on_project:
-                        on_project(project.name, f"error: {exc}", git_ops)
-            return
+                return "errored", git_ops, exc
+            return "cloned", git_ops, None
 
         if is_dirty(project.path):
-            with lock:
-                result.skipped.append(project.name)
-                if on_project:
-                    on_project(project.name, "skipped (dirty)", [])
-            return
+            return "skipped", git_ops, None
 
-        git_ops = []
         try:
             pull_output = pull_repo(project.path)
             git_ops.append((f"git -C {expanded} pull", pull_output))
             push_output = push_repo(project.path)
             git_ops.append((f"git -C {expanded} push", push_output))
-            with lock:
-                result.synced.append(project.name)
-                if on_project:
-                    on_project(project.name, "synced", git_ops)
         except GitError as exc:
-            with lock:
-                result.errored.append((project.name, str(exc)))
-                if on_project:
-                    on_project(project.name, f"error: {exc}", git_ops)
+            return "errored", git_ops, exc
+        return "synced", git_ops, None
 
+    # workers only run git; results and callbacks are handled here, on the calling thread
+    result = SyncResult()
+    done = {"cloned": result.cloned, "synced": result.synced, "skipped": result.skipped}
     with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
-        futures = [executor.submit(_sync_one, p) for p in projects]
+        futures = {executor.submit(_sync_one, p): p.name for p in projects}
         for future in as_completed(futures):
-            future.result()
+            name = futures[future]
+            outcome, git_ops, error = future.result()
+            if error is not None:
+                result.errored.append((name, str(error)))
+                status = f"error: {error}"
+            else:
+                done[outcome].append(name)
+                status = "skipped (dirty)" if outcome == "skipped" else outcome
+            if on_project:
+                on_project(name, status, git_ops)
 
     return result
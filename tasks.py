@@ -19,9 +19,7 @@ def format(c):
 @task(pre=[format])
 def lint(c):
     """Run linters."""
-    c.run("uv run ruff check src tests")
-    c.run("uv run ruff format --check src tests")
-    c.run("uv run mypy src")
+    c.run("uv run -- sh -c 'ruff check src tests && ruff format --check src tests && mypy src'")
 
 
 @task
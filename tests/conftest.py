@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import functools
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep foundry API responses cached by tests out of the user's cache directory.
+
+    The directory is only created for tests that actually reach the HTTP cache.
+    """
+    monkeypatch.setattr(
+        "git_projects.httpcache.get_cache_dir",
+        functools.cache(lambda: tmp_path_factory.mktemp("http-cache")),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_index(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep index.json and its cache files out of the user's data directory.
+
+    Tests that care about the index location patch get_index_path themselves.
+    """
+    monkeypatch.setattr(
+        "git_projects.index.get_index_path",
+        functools.cache(lambda: tmp_path_factory.mktemp("index") / "index.json"),
+    )
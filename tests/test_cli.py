@@ -16,9 +16,16 @@ from git_projects.foundry import RemoteRepo
 runner = CliRunner()
 
 
+# taken once when this module is imported; test_format_age passes it as 'now' too
+_NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
 def _ts(delta: timedelta) -> str:
-    return (datetime.now(timezone.utc) - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (_NOW - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
+_AUTH_REQUEST = httpx.Request("GET", "https://api.github.com/user/repos")
+_AUTH_RESPONSE = httpx.Response(401, request=_AUTH_REQUEST)
 
 _GH_FOUNDRY = FoundryConfig(name="github", type="github", url="https://api.github.com", token="tok")
 
@@ -133,7 +140,7 @@ def test_fetch_happy_path() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS),
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS),
         patch("git_projects.services.index.save_index"),
         patch("git_projects.cli.config.load_config", return_value=cfg),
     ):
@@ -147,7 +154,7 @@ def test_fetch_by_foundry_name() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS),
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS),
         patch("git_projects.services.index.save_index"),
         patch("git_projects.cli.config.load_config", return_value=cfg),
     ):
@@ -180,7 +187,8 @@ def test_fetch_empty_token() -> None:
 
     with (
         patch("git_projects.cli.config.load_config", return_value=cfg),
-        patch("git_projects.services.github.list_repos", side_effect=ValueError("token")),
+        patch("git_projects.foundry.github.list_repos", side_effect=ValueError("token")),
+        patch("git_projects.services.index.save_index"),
     ):
         result = runner.invoke(app, ["fetch"])
 
@@ -190,16 +198,17 @@ def test_fetch_empty_token() -> None:
 
 def test_fetch_auth_error() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
-    request = httpx.Request("GET", "https://api.github.com/user/repos")
-    response = httpx.Response(401)
-    response.request = request
 
     with (
         patch("git_projects.cli.config.load_config", return_value=cfg),
         patch(
-            "git_projects.services.github.list_repos",
-            side_effect=httpx.HTTPStatusError("401", request=request, response=response),
+            "git_projects.foundry.github.list_repos",
+            # a fresh exception: raising sets __traceback__/__context__ on the instance
+            side_effect=httpx.HTTPStatusError(
+                "401", request=_AUTH_REQUEST, response=_AUTH_RESPONSE
+            ),
         ),
+        patch("git_projects.services.index.save_index"),
     ):
         result = runner.invoke(app, ["fetch"])
 
@@ -496,24 +505,22 @@ def test_info_version_fallback() -> None:
     assert "unknown" in result.output
 
 
-def test_format_age_just_now() -> None:
-    now = datetime.now(timezone.utc)
-    assert _format_age(now) == "just now"
+@pytest.mark.parametrize(
+    ("delta", "expected"),
+    [
+        (timedelta(0), "just now"),
+        (timedelta(minutes=15), "15m ago"),
+        (timedelta(hours=5), "5h ago"),
+        (timedelta(days=3), "3d ago"),
+    ],
+)
+def test_format_age(delta: timedelta, expected: str) -> None:
+    assert _format_age(_NOW - delta, _NOW) == expected
 
 
-def test_format_age_minutes() -> None:
-    dt = datetime.now(timezone.utc) - timedelta(minutes=15)
-    assert _format_age(dt) == "15m ago"
-
-
-def test_format_age_hours() -> None:
-    dt = datetime.now(timezone.utc) - timedelta(hours=5)
-    assert _format_age(dt) == "5h ago"
-
-
-def test_format_age_days() -> None:
-    dt = datetime.now(timezone.utc) - timedelta(days=3)
-    assert _format_age(dt) == "3d ago"
+def test_format_age_uses_given_now() -> None:
+    now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    assert _format_age(now - timedelta(minutes=5), now) == "5m ago"
 
 
 # --- sync command ---
@@ -565,6 +572,21 @@ def test_sync_calls_sync_projects_with_resolved_paths() -> None:
     assert mock_sync.call_args[1]["max_workers"] == 4
 
 
+def test_sync_keeps_absolute_project_path() -> None:
+    sync_result = SyncResult(synced=["a"])
+    projects = [Project(clone_url="https://github.com/u/a.git", name="a", path="/srv/a")]
+
+    with (
+        patch("git_projects.cli.config.load_config", return_value=_sync_cfg()),
+        patch("git_projects.cli.config.load_projects", return_value=projects),
+        patch("git_projects.cli.sync_projects", return_value=sync_result) as mock_sync,
+    ):
+        result = runner.invoke(app, ["sync"])
+
+    assert result.exit_code == 0
+    assert mock_sync.call_args[0][0][0].path == "/srv/a"
+
+
 def test_sync_workers_flag() -> None:
     """sync --workers N passes max_workers to sync_projects."""
     sync_result = SyncResult(cloned=[], synced=["a"], skipped=[], errored=[])
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+import shutil
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -77,6 +80,117 @@ def test_load_config_missing_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
         load_config()
 
 
+def test_load_config_reuses_parse_when_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, "clone_root: ~/projects\nfoundries: []\n")
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+
+    first = load_config()
+    with patch("yaml.load") as mock_load:
+        second = load_config()
+
+    mock_load.assert_not_called()
+    assert second == first
+    assert second is not first
+
+
+def test_load_config_reparses_after_file_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, "clone_root: ~/projects\nfoundries: []\n")
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+
+    load_config()
+    _write_config(config_path, "clone_root: ~/elsewhere\nfoundries: []\n")
+
+    assert load_config().clone_root == "~/elsewhere"
+
+
+def test_load_config_writes_and_prefers_json_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    sidecar = tmp_path / "config.yaml.json"
+    _write_config(config_path, "clone_root: ~/projects\nfoundries: []\n")
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+
+    load_config()
+    assert json.loads(sidecar.read_text())["config"]["clone_root"] == "~/projects"
+
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+    with patch("yaml.load") as mock_load:
+        config = load_config()
+
+    mock_load.assert_not_called()
+    assert config.clone_root == "~/projects"
+
+
+def test_load_config_ignores_corrupt_json_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    sidecar = tmp_path / "config.yaml.json"
+    _write_config(config_path, "clone_root: ~/projects\nfoundries: []\n")
+    sidecar.write_text('{"clone_root": ')
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+
+    assert load_config().clone_root == "~/projects"
+    assert json.loads(sidecar.read_text())["config"]["clone_root"] == "~/projects"
+
+
+def test_load_config_ignores_sidecar_after_restoring_older_yaml(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    backup = tmp_path / "config.yaml.bak"
+    _write_config(config_path, "clone_root: ~/old\nfoundries: []\n")
+    shutil.copy2(config_path, backup)
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+    _write_config(config_path, "clone_root: ~/new\nfoundries: []\n")
+    assert load_config().clone_root == "~/new"
+
+    # restoring with cp -p keeps the backup's older mtime
+    shutil.copy2(backup, config_path)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+
+    assert load_config().clone_root == "~/old"
+
+
+def test_json_sidecar_gets_config_permissions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, "clone_root: ~/projects\nfoundries: []\n")
+    config_path.chmod(0o600)
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+
+    load_config()
+
+    assert (tmp_path / "config.yaml.json").stat().st_mode & 0o777 == 0o600
+    assert not (tmp_path / "config.yaml.json.tmp").exists()
+
+
+def test_json_sidecar_follows_later_chmod_of_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    sidecar = tmp_path / "config.yaml.json"
+    _write_config(config_path, "clone_root: ~/projects\nfoundries: []\n")
+    config_path.chmod(0o644)
+    monkeypatch.setattr("git_projects.config.get_config_path", lambda: config_path)
+    load_config()
+    assert sidecar.stat().st_mode & 0o777 == 0o644
+
+    config_path.chmod(0o600)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+    load_config()
+
+    assert sidecar.stat().st_mode & 0o777 == 0o600
+
+
 # --- save_config ---
 
 
@@ -201,6 +315,16 @@ def test_get_projects_path_returns_path() -> None:
     assert p.name == "projects.json"
 
 
+def test_get_projects_path_is_memoized() -> None:
+    assert get_projects_path() is get_projects_path()
+
+
+def test_project_is_frozen() -> None:
+    project = Project(clone_url="https://github.com/u/a.git", name="a", path="a")
+    with pytest.raises(FrozenInstanceError):
+        project.path = "b"  # type: ignore[misc]
+
+
 # --- derive_project ---
 
 
@@ -238,3 +362,14 @@ def test_derive_project_ssh_nested_path() -> None:
     project = derive_project("git@gitea.host:org/sub/repo.git")
     assert project.name == "repo"
     assert project.path == "repo"
+
+
+def test_derive_project_ssh_without_owner() -> None:
+    project = derive_project("git@host.example:repo.git")
+    assert project.name == "repo"
+    assert project.path == "repo"
+
+
+def test_derive_project_trailing_slash() -> None:
+    project = derive_project("https://github.com/user/repo/")
+    assert project.name == "repo"
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from git_projects.filecache import cached_read, remember
+
+
+def test_cached_read_parses_once_while_unchanged(tmp_path: Path) -> None:
+    path = tmp_path / "state.txt"
+    path.write_text("a")
+    calls: list[Path] = []
+
+    def _parse(p: Path) -> list[str]:
+        calls.append(p)
+        return [p.read_text()]
+
+    first = cached_read(path, _parse, list)
+    second = cached_read(path, _parse, list)
+
+    assert first == second == ["a"]
+    assert first is not second
+    assert len(calls) == 1
+
+
+def test_cached_read_reparses_after_change(tmp_path: Path) -> None:
+    path = tmp_path / "state.txt"
+    path.write_text("a")
+    cached_read(path, lambda p: [p.read_text()], list)
+
+    path.write_text("bb")
+
+    assert cached_read(path, lambda p: [p.read_text()], list) == ["bb"]
+
+
+def test_remember_serves_written_value(tmp_path: Path) -> None:
+    path = tmp_path / "state.txt"
+    path.write_text("a")
+    remember(path, ["written"])
+
+    assert cached_read(path, lambda p: [p.read_text()], list) == ["written"]
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 import pytest
 import typer
 
-from git_projects.formatting import format_repo, relative_time
+from git_projects.formatting import bold, dim, format_repo, relative_time
 from git_projects.foundry import RemoteRepo
 
 
@@ -17,8 +17,12 @@ def _strip_ansi(s: str) -> str:
 # --- relative_time ---
 
 
+# taken once when this module is imported; test_relative_time passes it as 'now' too
+_NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
 def _ts(delta: timedelta) -> str:
-    return (datetime.now(timezone.utc) - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (_NOW - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 @pytest.mark.parametrize(
@@ -34,7 +38,12 @@ def _ts(delta: timedelta) -> str:
     ],
 )
 def test_relative_time(delta: timedelta, expected: str) -> None:
-    assert relative_time(_ts(delta)) == expected
+    assert relative_time(_ts(delta), _NOW) == expected
+
+
+def test_relative_time_uses_given_now() -> None:
+    now = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    assert relative_time("2026-01-07T00:00:00Z", now) == "3 days ago"
 
 
 def test_relative_time_invalid() -> None:
@@ -42,6 +51,14 @@ def test_relative_time_invalid() -> None:
         relative_time("not-a-timestamp")
 
 
+# --- stylers ---
+
+
+def test_stylers_match_typer_style() -> None:
+    assert bold("x") == typer.style("x", bold=True)
+    assert dim("x") == typer.style("x", dim=True)
+
+
 # --- format_repo ---
 
 _REPO = RemoteRepo(
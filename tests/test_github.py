@@ -7,8 +7,8 @@ import httpx
 import pytest
 
 from git_projects.config import FoundryConfig
-from git_projects.foundry import RemoteRepo
-from git_projects.foundry.github import _next_url, list_repos
+from git_projects.foundry import RemoteRepo, next_url
+from git_projects.foundry.github import list_repos
 
 FOUNDRY = FoundryConfig(name="github", type="github", url="https://api.github.com", token="tok")
 
@@ -42,31 +42,40 @@ def _make_response(
     *,
     link: str = "",
     status: int = 200,
+    etag: str = "",
 ) -> httpx.Response:
+    headers = {"Link": link} if link else {}
+    if etag:
+        headers["ETag"] = etag
     response = httpx.Response(
         status_code=status,
-        headers={"Link": link} if link else {},
+        headers=headers,
         content=json.dumps(data).encode(),
     )
     response.request = _DUMMY_REQUEST
     return response
 
 
-# --- _next_url ---
+# --- next_url ---
 
 
 def test_next_url_present() -> None:
     header = '<https://api.github.com/user/repos?page=2>; rel="next", <https://api.github.com/user/repos?page=5>; rel="last"'
-    assert _next_url(header) == "https://api.github.com/user/repos?page=2"
+    assert next_url(header) == "https://api.github.com/user/repos?page=2"
 
 
 def test_next_url_absent() -> None:
     header = '<https://api.github.com/user/repos?page=1>; rel="first"'
-    assert _next_url(header) is None
+    assert next_url(header) is None
+
+
+def test_next_url_not_first_entry() -> None:
+    header = '<https://api.github.com/user/repos?page=1>; rel="prev", <https://api.github.com/user/repos?page=3>; rel="next"'
+    assert next_url(header) == "https://api.github.com/user/repos?page=3"
 
 
 def test_next_url_empty() -> None:
-    assert _next_url("") is None
+    assert next_url("") is None
 
 
 # --- list_repos ---
@@ -143,6 +152,65 @@ def test_list_repos_pagination() -> None:
     assert mock_client.get.call_count == 2
 
 
+def test_list_repos_fetches_remaining_pages_when_last_is_known() -> None:
+    """Pages 2..last are requested up front and results keep page order."""
+    base = "https://api.github.com/user/repos?per_page=100"
+    repo_3 = {**_REPO_2, "name": "proj-c"}
+    pages = {
+        f"{base}&page=2": _make_response([_REPO_2]),
+        f"{base}&page=3": _make_response([repo_3]),
+    }
+    page1 = _make_response(
+        [_REPO_1],
+        link=f'<{base}&page=2>; rel="next", <{base}&page=3>; rel="last"',
+    )
+
+    with patch("git_projects.foundry.github.httpx.Client") as MockClient:
+        mock_client = MagicMock()
+        MockClient.return_value.__enter__ = MagicMock(return_value=mock_client)
+        MockClient.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client.get.side_effect = lambda url, **_: pages.get(url, page1)
+
+        repos = list_repos(FOUNDRY)
+
+    assert [r.name for r in repos] == ["proj-a", "proj-b", "proj-c"]
+    assert mock_client.get.call_count == 3
+
+
+def test_list_repos_reuses_cached_page_on_not_modified() -> None:
+    """A 304 answer to the If-None-Match revalidation replays the cached page."""
+    with patch("git_projects.foundry.github.httpx.Client") as MockClient:
+        mock_client = MagicMock()
+        mock_client.headers = {"Authorization": "Bearer tok"}
+        MockClient.return_value.__enter__ = MagicMock(return_value=mock_client)
+        MockClient.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client.get.side_effect = [
+            _make_response([_REPO_1], etag='"v1"'),
+            _make_response([], status=304),
+        ]
+
+        first = list_repos(FOUNDRY)
+        second = list_repos(FOUNDRY)
+
+    assert second == first
+    assert mock_client.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_list_repos_uses_http2_when_h2_is_installed() -> None:
+    with (
+        patch("git_projects.foundry.github.http2_available", return_value=True),
+        patch("git_projects.foundry.github.httpx.Client") as MockClient,
+    ):
+        mock_client = MagicMock()
+        MockClient.return_value.__enter__ = MagicMock(return_value=mock_client)
+        MockClient.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client.get.return_value = _make_response([])
+
+        list_repos(FOUNDRY)
+
+    assert MockClient.call_args.kwargs["http2"] is True
+
+
 def test_list_repos_auth_error_raises() -> None:
     """AC-07: 401 from API raises HTTPStatusError."""
     mock_response = _make_response([], status=401)
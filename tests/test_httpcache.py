@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from git_projects.httpcache import CachedPage, lookup, prune, store
+
+_URL = "https://api.github.com/user/repos?page=1"
+_AUTH = {"Authorization": "Bearer tok"}
+
+
+def test_store_and_lookup_roundtrip() -> None:
+    page = CachedPage(etag='"abc"', last_modified=None, link="", items=[{"name": "proj-a"}])
+    store(_URL, _AUTH, page)
+    assert lookup(_URL, _AUTH) == page
+
+
+def test_lookup_is_keyed_by_headers() -> None:
+    store(_URL, _AUTH, CachedPage(etag='"abc"', last_modified=None, link="", items=[]))
+    assert lookup(_URL, {"Authorization": "Bearer other"}) is None
+
+
+def test_store_skips_pages_without_validators() -> None:
+    store(_URL, _AUTH, CachedPage(etag=None, last_modified=None, link="", items=[]))
+    assert lookup(_URL, _AUTH) is None
+
+
+def test_validators() -> None:
+    page = CachedPage(
+        etag='"abc"', last_modified="Mon, 01 Jan 2026 00:00:00 GMT", link="", items=[]
+    )
+    assert page.validators() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT",
+    }
+
+
+def test_prune_removes_unused_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("git_projects.httpcache.get_cache_dir", lambda: tmp_path)
+    old_token = {"Authorization": "Bearer old"}
+    store(_URL, old_token, CachedPage(etag='"abc"', last_modified=None, link="", items=[]))
+    store(_URL, _AUTH, CachedPage(etag='"abc"', last_modified=None, link="", items=[]))
+    stale = time.time() - 30 * 24 * 60 * 60
+    for path in tmp_path.glob("*.json"):
+        os.utime(path, (stale, stale))
+
+    assert lookup(_URL, _AUTH) is not None  # a hit marks the entry as in use
+    prune()
+
+    assert lookup(_URL, old_token) is None
+    assert lookup(_URL, _AUTH) is not None
+    assert len(list(tmp_path.glob("*.json"))) == 1
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import json
+import os
+import pickle
+import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
+from git_projects import jsonio
 from git_projects.foundry import RemoteRepo
-from git_projects.index import load_index, save_index, search_index
+from git_projects.index import (
+    index_by_name,
+    load_index,
+    load_index_meta,
+    save_index,
+    search_index,
+)
+
+# taken once when this module is imported, so all _ts() fixtures share one base time
+_NOW = datetime.now(timezone.utc).replace(microsecond=0)
 
 
 def _ts(delta: timedelta) -> str:
-    return (datetime.now(timezone.utc) - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (_NOW - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 _REPOS = [
@@ -64,24 +78,211 @@ def test_load_index_returns_empty_when_missing(
     assert load_index() == []
 
 
-def test_search_index_no_filter() -> None:
-    result = search_index(_REPOS)
-    assert len(result) == 3
+def test_load_index_prefers_pickle_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+    save_index(_REPOS)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+
+    def fail(data: bytes) -> None:
+        raise AssertionError("index.json should not be parsed")
+
+    monkeypatch.setattr("git_projects.index.jsonio.loads", fail)
+    assert load_index() == _REPOS
+
+
+def test_load_index_ignores_stale_pickle_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS)
+    # an external tool rewrites index.json after the cache was written
+    data = json.loads(index_path.read_text())
+    data["repos"] = data["repos"][:1]
+    index_path.write_text(json.dumps(data))
+    st = (tmp_path / "index.cache.pkl").stat()
+    os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert [r.name for r in load_index()] == ["proj-a"]
+
+
+def test_load_index_ignores_pickle_for_restored_older_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS[:1])
+    backup = index_path.read_bytes()
+    st = index_path.stat()
+    save_index(_REPOS)
+    # a `cp -p` restore of the earlier index.json, older than the pickle
+    index_path.write_bytes(backup)
+    os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+
+    assert [r.name for r in load_index()] == ["proj-a"]
+
+
+def test_load_index_ignores_pickle_from_other_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+    monkeypatch.setattr("git_projects.index.__version__", "999.0.0")
+    parsed: list[bytes] = []
+    real_loads = jsonio.loads
+
+    def spy(data: bytes) -> object:
+        parsed.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr("git_projects.index.jsonio.loads", spy)
+
+    assert load_index() == _REPOS
+    assert parsed
+
+
+def test_load_index_ignores_corrupt_pickle_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+    (tmp_path / "index.cache.pkl").write_bytes(b"not a pickle")
+    os.utime(tmp_path / "index.cache.pkl", ns=(0, index_path.stat().st_mtime_ns + 1))
+
+    assert load_index() == _REPOS
+
+
+class _TouchOnLoad:
+    """Pickles as a call to Path.touch, standing in for a hostile index.cache.pkl."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def __reduce__(self) -> tuple[object, ...]:
+        return (Path.touch, (self.path,))
+
+
+def test_load_index_refuses_pickle_that_runs_code(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    marker = tmp_path / "pwned"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS)
+    monkeypatch.setattr("git_projects.filecache._CACHE", {})
+    (tmp_path / "index.cache.pkl").write_bytes(pickle.dumps(_TouchOnLoad(marker)))
+
+    assert load_index() == _REPOS
+    assert not marker.exists()
+
+
+def test_save_index_writes_meta(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+
+    save_index(_REPOS)
+    meta = load_index_meta()
+
+    assert (tmp_path / "index.meta.json").exists()
+    assert meta is not None
+    assert meta.n_repos == 3
 
 
-def test_search_index_filters_by_query_name() -> None:
-    result = search_index(_REPOS, "proj-a")
-    assert len(result) == 1
-    assert result[0].name == "proj-a"
+def test_load_index_meta_falls_back_to_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    index_path.write_text(json.dumps({"updated_at": "2026-01-01T00:00:00+00:00", "repos": [{}]}))
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+
+    meta = load_index_meta()
+
+    assert meta is not None
+    assert meta.n_repos == 1
+    assert meta.updated_at == "2026-01-01T00:00:00+00:00"
+
+
+@pytest.mark.parametrize("content", [b'{"n_repos": ', b'{"n_repos": 3}', b"[]"])
+def test_load_index_meta_ignores_corrupt_summary(
+    content: bytes, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS)
+    meta_path = tmp_path / "index.meta.json"
+    meta_path.write_bytes(content)
+    os.utime(meta_path, ns=(0, index_path.stat().st_mtime_ns + 1))
 
+    meta = load_index_meta()
+
+    assert meta is not None
+    assert meta.n_repos == 3
+
+
+def test_save_index_survives_unwritable_meta(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    (tmp_path / "index.meta.json").mkdir()
+
+    assert save_index(_REPOS) == index_path
+    assert load_index_meta() is not None
+
+
+def test_load_index_meta_ignores_summary_after_restoring_older_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index_path = tmp_path / "index.json"
+    backup = tmp_path / "index.json.bak"
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: index_path)
+    save_index(_REPOS[:1])
+    shutil.copy2(index_path, backup)
+    save_index(_REPOS)
+
+    shutil.copy2(backup, index_path)
+    meta = load_index_meta()
+
+    assert meta is not None
+    assert meta.n_repos == len(load_index()) == 1
+
+
+def test_load_index_meta_missing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("git_projects.index.get_index_path", lambda: tmp_path / "index.json")
+    assert load_index_meta() is None
+
+
+def test_index_by_name_keys_name_and_slug() -> None:
+    spaced = RemoteRepo(
+        name="My Tool",
+        repo_url="https://gitea.example.com/user/my-tool",
+        clone_url="git@gitea.example.com:user/my-tool.git",
+        pushed_at=_ts(timedelta(days=1)),
+        default_branch="main",
+        visibility="public",
+        description="",
+    )
+    table = index_by_name([*_REPOS, spaced])
 
-def test_search_index_filters_by_query_description() -> None:
-    result = search_index(_REPOS, "ancient")
-    assert len(result) == 1
-    assert result[0].name == "old-thing"
+    assert table["proj-a"] == (_REPOS[0],)
+    assert table["My Tool"] == table["my-tool"] == (spaced,)
 
 
-def test_search_index_query_is_case_insensitive() -> None:
-    result = search_index(_REPOS, "ALPHA")
-    assert len(result) == 1
-    assert result[0].name == "proj-a"
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        (None, ["old-thing", "proj-b", "proj-a"]),  # no filter, oldest push first
+        ("proj-a", ["proj-a"]),  # name
+        ("ancient", ["old-thing"]),  # description
+        ("ALPHA", ["proj-a"]),  # case-insensitive
+    ],
+)
+def test_search_index(query: str | None, expected: list[str]) -> None:
+    assert [r.name for r in search_index(_REPOS, query)] == expected
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from git_projects import jsonio
+
+
+def test_roundtrip() -> None:
+    data = {"repos": [{"name": "proj-a", "description": "naïve"}], "n": 1}
+    assert jsonio.loads(jsonio.dumps(data)) == data
+
+
+def test_dumps_indent() -> None:
+    out = jsonio.dumps([{"a": 1}], indent=True)
+    assert isinstance(out, bytes)
+    assert b'\n  {\n    "a": 1\n  }\n' in out
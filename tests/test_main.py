@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+
+from git_projects.__main__ import main
+
+
+def test_main_version_fast_path(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr("sys.argv", ["gpr", "--version"])
+
+    with (
+        patch("importlib.metadata.version", return_value="1.2.3"),
+        patch("git_projects.cli.app") as mock_app,
+    ):
+        main()
+
+    assert capsys.readouterr().out.strip() == "1.2.3"
+    mock_app.assert_not_called()
+
+
+def test_main_delegates_to_app(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.argv", ["gpr", "list"])
+
+    with patch("git_projects.cli.app") as mock_app:
+        main()
+
+    mock_app.assert_called_once_with()
+
+
+def test_package_version_uses_distribution_name() -> None:
+    import git_projects
+
+    with patch("importlib.metadata.version", return_value="1.2.3") as mock_version:
+        importlib.reload(git_projects)
+    importlib.reload(git_projects)
+
+    mock_version.assert_called_once_with("git-proj")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -41,7 +42,7 @@ def test_fetch_repos_returns_repos() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS),
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS),
         patch("git_projects.services.index.save_index"),
     ):
         result = fetch_repos(cfg)
@@ -53,7 +54,7 @@ def test_fetch_repos_sorted_ascending() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS),
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS),
         patch("git_projects.services.index.save_index"),
     ):
         result = fetch_repos(cfg)
@@ -66,7 +67,7 @@ def test_fetch_repos_saves_to_index() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS),
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS),
         patch("git_projects.services.index.save_index") as mock_save,
     ):
         fetch_repos(cfg)
@@ -80,7 +81,7 @@ def test_fetch_repos_by_foundry_name() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY])
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS),
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS),
         patch("git_projects.services.index.save_index"),
     ):
         result = fetch_repos(cfg, "github")
@@ -92,7 +93,7 @@ def test_fetch_repos_passes_clone_url_format() -> None:
     cfg = Config(clone_root="~/projects", foundries=[_GH_FOUNDRY], clone_url_format="https")
 
     with (
-        patch("git_projects.services.github.list_repos", return_value=_REMOTE_REPOS) as mock_lr,
+        patch("git_projects.foundry.github.list_repos", return_value=_REMOTE_REPOS) as mock_lr,
         patch("git_projects.services.index.save_index"),
     ):
         fetch_repos(cfg)
@@ -118,7 +119,7 @@ def test_fetch_repos_missing_token() -> None:
             errors.append((name, exc))
 
     with (
-        patch("git_projects.services.github.list_repos", side_effect=ValueError("token")),
+        patch("git_projects.foundry.github.list_repos", side_effect=ValueError("token")),
         patch("git_projects.services.index.save_index"),
     ):
         fetch_repos(cfg, on_foundry=_on_foundry)
@@ -146,6 +147,20 @@ def test_track_project_by_url() -> None:
     mock_save.assert_called_once_with([project])
 
 
+def test_track_project_path_override_keeps_derived_name() -> None:
+    cfg = Config(clone_root="~/projects", foundries=[])
+
+    with (
+        patch("git_projects.services.config.load_projects", return_value=[]),
+        patch("git_projects.services.config.save_projects"),
+    ):
+        project = track_project(cfg, "git@github.com:user/repo-a.git/", path="work/a")
+
+    assert project == Project(
+        clone_url="git@github.com:user/repo-a.git/", name="repo-a", path="work/a"
+    )
+
+
 def test_track_project_duplicate() -> None:
     """AC-08: duplicate clone_url raises ValueError."""
     cfg = Config(clone_root="~/projects", foundries=[])
@@ -223,6 +238,52 @@ def test_track_project_name_ambiguous() -> None:
         track_project(cfg, "proj")
 
 
+def test_track_project_ambiguous_lists_at_most_ten_matches() -> None:
+    cfg = Config(clone_root="~/projects", foundries=[])
+    many = [
+        RemoteRepo(
+            name=f"tool-{i:02d}",
+            repo_url=f"https://github.com/u/tool-{i:02d}",
+            clone_url=f"git@github.com:u/tool-{i:02d}.git",
+            pushed_at="2026-01-01T00:00:00Z",
+            default_branch="main",
+            visibility="public",
+            description="",
+        )
+        for i in range(25)
+    ]
+
+    with (
+        patch("git_projects.services.index.load_index", return_value=many),
+        pytest.raises(ValueError, match=r"tool-09, \.\.\.") as excinfo,
+    ):
+        track_project(cfg, "tool")
+
+    assert "tool-10" not in str(excinfo.value)
+
+
+def test_track_project_ambiguous_lists_matches_in_index_order() -> None:
+    cfg = Config(clone_root="~/projects", foundries=[])
+    repos = [
+        RemoteRepo(
+            name=name,
+            repo_url=f"https://{host}/u/{name}",
+            clone_url=f"git@{host}:u/{name}.git",
+            pushed_at="2026-01-01T00:00:00Z",
+            default_branch="main",
+            visibility="public",
+            description="",
+        )
+        for name, host in [("x-b", "github.com"), ("y-b", "github.com"), ("x-b", "gitlab.com")]
+    ]
+
+    with (
+        patch("git_projects.services.index.load_index", return_value=repos),
+        pytest.raises(ValueError, match="matches: x-b, y-b, x-b\\."),
+    ):
+        track_project(cfg, "b")
+
+
 # --- untrack_project ---
 
 
@@ -264,16 +325,12 @@ _PROJECTS = [
 
 def test_sync_clones_missing_repo() -> None:
     with (
-        patch("git_projects.services.Path") as mock_path,
+        patch("git_projects.services.os.path.exists", return_value=False),
         patch("git_projects.services.clone_repo") as mock_clone,
         patch("git_projects.services.is_dirty"),
         patch("git_projects.services.pull_repo"),
         patch("git_projects.services.push_repo"),
     ):
-        mock_path.return_value.expanduser.return_value = mock_path.return_value
-        mock_path.return_value.__str__ = lambda self: "/repos/a"
-        mock_path.return_value.exists.return_value = False
-
         result = sync_projects([_PROJECTS[0]])
 
     assert result.cloned == ["a"]
@@ -316,13 +373,9 @@ def test_sync_skips_dirty_repo(tmp_path: Path) -> None:
 
 def test_sync_records_clone_error() -> None:
     with (
-        patch("git_projects.services.Path") as mock_path,
+        patch("git_projects.services.os.path.exists", return_value=False),
         patch("git_projects.services.clone_repo", side_effect=GitError("auth failed")),
     ):
-        mock_path.return_value.expanduser.return_value = mock_path.return_value
-        mock_path.return_value.__str__ = lambda self: "/repos/a"
-        mock_path.return_value.exists.return_value = False
-
         result = sync_projects([_PROJECTS[0]])
 
     assert result.errored == [("a", "auth failed")]
@@ -412,6 +465,30 @@ def test_sync_parallel_processes_all_projects(tmp_path: Path) -> None:
     assert sorted(result.synced) == ["a", "b", "c", "d"]
 
 
+def test_sync_calls_on_project_on_calling_thread(tmp_path: Path) -> None:
+    """Callbacks run on the caller's thread even though git work runs on the pool."""
+    projects = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        projects.append(
+            Project(
+                clone_url=f"https://github.com/u/{name}.git", name=name, path=str(tmp_path / name)
+            )
+        )
+    threads: list[threading.Thread] = []
+
+    with (
+        patch("git_projects.services.is_dirty", return_value=False),
+        patch("git_projects.services.pull_repo"),
+        patch("git_projects.services.push_repo"),
+    ):
+        sync_projects(
+            projects, on_project=lambda n, s, ops: threads.append(threading.current_thread())
+        )
+
+    assert threads == [threading.current_thread()] * 2
+
+
 def test_sync_max_workers_one_is_sequential(tmp_path: Path) -> None:
     """max_workers=1 processes projects one at a time."""
     repo = tmp_path / "a"